@@ -1,10 +1,10 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class AccountStatus(str, Enum):
+class AccountStatus(StrEnum):
     ACTIVE = "active"
     INVITED = "invited"
     SUSPENDED = "suspended"
 
-    def __str__(self) -> str:
-        return str(self.value)
+
+_ACCOUNT_STATUS_LOOKUP: dict[str, AccountStatus] = {member.value: member for member in AccountStatus}
@@ -1,5 +1,5 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
@@ -15,12 +15,12 @@ class ApiError:
     Attributes:
         code (str):
         message (str):
-        detail (Union[None, Unset, str]):
+        detail (None | Unset | str):
     """
 
     code: str
     message: str
-    detail: Union[None, Unset, str] = UNSET
+    detail: None | Unset | str = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -28,20 +28,13 @@ class ApiError:
 
         message = self.message
 
-        detail: Union[None, Unset, str]
-        if isinstance(self.detail, Unset):
-            detail = UNSET
-        else:
-            detail = self.detail
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "code": code,
-                "message": message,
-            }
-        )
+        detail = self.detail
+
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "code": code,
+            "message": message,
+        }
         if detail is not UNSET:
             field_dict["detail"] = detail
 
@@ -54,14 +47,7 @@ class ApiError:
 
         message = d.pop("message")
 
-        def _parse_detail(data: object) -> Union[None, Unset, str]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(Union[None, Unset, str], data)
-
-        detail = _parse_detail(d.pop("detail", UNSET))
+        detail: None | Unset | str = d.pop("detail", UNSET)
 
         api_error = cls(
             code=code,
@@ -69,7 +55,8 @@ class ApiError:
             detail=detail,
         )
 
-        api_error.additional_properties = d
+        if d:
+            api_error.additional_properties = d
         return api_error
 
     @property
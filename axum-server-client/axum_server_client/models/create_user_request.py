@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..models.role import Role
+from ..models.role import _ROLE_LOOKUP, Role
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="CreateUserRequest")
@@ -16,14 +16,14 @@ class CreateUserRequest:
     Attributes:
         email (str):
         username (str):
-        roles (Union[Unset, list[Role]]):
-        timezone (Union[None, Unset, str]):
+        roles (Unset | list[Role]):
+        timezone (None | Unset | str):
     """
 
     email: str
     username: str
-    roles: Union[Unset, list[Role]] = UNSET
-    timezone: Union[None, Unset, str] = UNSET
+    roles: Unset | list[Role] = UNSET
+    timezone: None | Unset | str = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -31,27 +31,17 @@ class CreateUserRequest:
 
         username = self.username
 
-        roles: Union[Unset, list[str]] = UNSET
-        if not isinstance(self.roles, Unset):
-            roles = []
-            for roles_item_data in self.roles:
-                roles_item = roles_item_data.value
-                roles.append(roles_item)
-
-        timezone: Union[None, Unset, str]
-        if isinstance(self.timezone, Unset):
-            timezone = UNSET
-        else:
-            timezone = self.timezone
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "email": email,
-                "username": username,
-            }
-        )
+        roles: Unset | list[str] = UNSET
+        if self.roles is not UNSET:
+            roles = [str(roles_item_data) for roles_item_data in self.roles]
+
+        timezone = self.timezone
+
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "email": email,
+            "username": username,
+        }
         if roles is not UNSET:
             field_dict["roles"] = roles
         if timezone is not UNSET:
@@ -66,21 +56,13 @@ class CreateUserRequest:
 
         username = d.pop("username")
 
-        roles = []
         _roles = d.pop("roles", UNSET)
-        for roles_item_data in _roles or []:
-            roles_item = Role(roles_item_data)
-
-            roles.append(roles_item)
-
-        def _parse_timezone(data: object) -> Union[None, Unset, str]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(Union[None, Unset, str], data)
+        try:
+            roles = [_ROLE_LOOKUP[roles_item_data] for roles_item_data in _roles or []]
+        except (KeyError, TypeError):
+            roles = [Role(roles_item_data) for roles_item_data in _roles]
 
-        timezone = _parse_timezone(d.pop("timezone", UNSET))
+        timezone: None | Unset | str = d.pop("timezone", UNSET)
 
         create_user_request = cls(
             email=email,
@@ -89,7 +71,8 @@ class CreateUserRequest:
             timezone=timezone,
         )
 
-        create_user_request.additional_properties = d
+        if d:
+            create_user_request.additional_properties = d
         return create_user_request
 
     @property
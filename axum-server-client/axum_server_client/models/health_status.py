@@ -1,11 +1,11 @@
 import datetime
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
+from .._parse import parse_datetime
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="HealthStatus")
@@ -17,12 +17,12 @@ class HealthStatus:
     Attributes:
         checked_at (datetime.datetime):
         status (str):
-        region (Union[None, Unset, str]):
+        region (None | Unset | str):
     """
 
     checked_at: datetime.datetime
     status: str
-    region: Union[None, Unset, str] = UNSET
+    region: None | Unset | str = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -30,20 +30,13 @@ class HealthStatus:
 
         status = self.status
 
-        region: Union[None, Unset, str]
-        if isinstance(self.region, Unset):
-            region = UNSET
-        else:
-            region = self.region
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "checked_at": checked_at,
-                "status": status,
-            }
-        )
+        region = self.region
+
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "checked_at": checked_at,
+            "status": status,
+        }
         if region is not UNSET:
             field_dict["region"] = region
 
@@ -52,18 +45,11 @@ class HealthStatus:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        checked_at = isoparse(d.pop("checked_at"))
+        checked_at = parse_datetime(d.pop("checked_at"))
 
         status = d.pop("status")
 
-        def _parse_region(data: object) -> Union[None, Unset, str]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(Union[None, Unset, str], data)
-
-        region = _parse_region(d.pop("region", UNSET))
+        region: None | Unset | str = d.pop("region", UNSET)
 
         health_status = cls(
             checked_at=checked_at,
@@ -71,7 +57,8 @@ class HealthStatus:
             region=region,
         )
 
-        health_status.additional_properties = d
+        if d:
+            health_status.additional_properties = d
         return health_status
 
     @property
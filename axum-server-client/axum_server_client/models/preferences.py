@@ -1,12 +1,12 @@
 import datetime
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..models.theme import Theme
+from .._parse import parse_datetime
+from ..models.theme import _THEME_LOOKUP, Theme
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="Preferences")
@@ -17,35 +17,28 @@ class Preferences:
     """
     Attributes:
         theme (Theme):
-        last_login_at (Union[Unset, datetime.datetime]):
-        timezone (Union[None, Unset, str]):
+        last_login_at (Unset | datetime.datetime):
+        timezone (None | Unset | str):
     """
 
     theme: Theme
-    last_login_at: Union[Unset, datetime.datetime] = UNSET
-    timezone: Union[None, Unset, str] = UNSET
+    last_login_at: Unset | datetime.datetime = UNSET
+    timezone: None | Unset | str = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        theme = self.theme.value
+        theme = str(self.theme)
 
-        last_login_at: Union[Unset, str] = UNSET
-        if not isinstance(self.last_login_at, Unset):
+        last_login_at: Unset | str = UNSET
+        if self.last_login_at is not UNSET:
             last_login_at = self.last_login_at.isoformat()
 
-        timezone: Union[None, Unset, str]
-        if isinstance(self.timezone, Unset):
-            timezone = UNSET
-        else:
-            timezone = self.timezone
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "theme": theme,
-            }
-        )
+        timezone = self.timezone
+
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "theme": theme,
+        }
         if last_login_at is not UNSET:
             field_dict["last_login_at"] = last_login_at
         if timezone is not UNSET:
@@ -56,23 +49,20 @@ class Preferences:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        theme = Theme(d.pop("theme"))
+        _theme = d.pop("theme")
+        try:
+            theme = _THEME_LOOKUP[_theme]
+        except (KeyError, TypeError):
+            theme = Theme(_theme)
 
         _last_login_at = d.pop("last_login_at", UNSET)
-        last_login_at: Union[Unset, datetime.datetime]
-        if isinstance(_last_login_at, Unset):
+        last_login_at: Unset | datetime.datetime
+        if _last_login_at is UNSET:
             last_login_at = UNSET
         else:
-            last_login_at = isoparse(_last_login_at)
-
-        def _parse_timezone(data: object) -> Union[None, Unset, str]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(Union[None, Unset, str], data)
+            last_login_at = parse_datetime(_last_login_at)
 
-        timezone = _parse_timezone(d.pop("timezone", UNSET))
+        timezone: None | Unset | str = d.pop("timezone", UNSET)
 
         preferences = cls(
             theme=theme,
@@ -80,7 +70,8 @@ class Preferences:
             timezone=timezone,
         )
 
-        preferences.additional_properties = d
+        if d:
+            preferences.additional_properties = d
         return preferences
 
     @property
@@ -1,10 +1,10 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class Role(str, Enum):
+class Role(StrEnum):
     ADMIN = "admin"
     EDITOR = "editor"
     VIEWER = "viewer"
 
-    def __str__(self) -> str:
-        return str(self.value)
+
+_ROLE_LOOKUP: dict[str, Role] = {member.value: member for member in Role}
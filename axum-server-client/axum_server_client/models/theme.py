@@ -1,10 +1,10 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class Theme(str, Enum):
+class Theme(StrEnum):
     DARK = "dark"
     LIGHT = "light"
     SYSTEM = "system"
 
-    def __str__(self) -> str:
-        return str(self.value)
+
+_THEME_LOOKUP: dict[str, Theme] = {member.value: member for member in Theme}
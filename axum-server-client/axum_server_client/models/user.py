@@ -1,19 +1,16 @@
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..models.account_status import AccountStatus
-from ..models.role import Role
+from .._parse import parse_datetime
+from ..models.account_status import _ACCOUNT_STATUS_LOOKUP, AccountStatus
+from ..models.preferences import Preferences
+from ..models.role import _ROLE_LOOKUP, Role
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.preferences import Preferences
-
-
 T = TypeVar("T", bound="User")
 
 
@@ -27,8 +24,8 @@ class User:
         id (int):
         status (AccountStatus):
         username (str):
-        preferences (Union['Preferences', None, Unset]):
-        roles (Union[Unset, list[Role]]):
+        preferences (Preferences | None | Unset):
+        roles (Unset | list[Role]):
     """
 
     active: bool
@@ -37,13 +34,11 @@ class User:
     id: int
     status: AccountStatus
     username: str
-    preferences: Union["Preferences", None, Unset] = UNSET
-    roles: Union[Unset, list[Role]] = UNSET
+    preferences: Preferences | None | Unset = UNSET
+    roles: Unset | list[Role] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.preferences import Preferences
-
         active = self.active
 
         created_at = self.created_at.isoformat()
@@ -52,37 +47,31 @@ class User:
 
         id = self.id
 
-        status = self.status.value
+        status = str(self.status)
 
         username = self.username
 
-        preferences: Union[None, Unset, dict[str, Any]]
-        if isinstance(self.preferences, Unset):
+        preferences: None | Unset | dict[str, Any]
+        if self.preferences is UNSET:
             preferences = UNSET
         elif isinstance(self.preferences, Preferences):
             preferences = self.preferences.to_dict()
         else:
             preferences = self.preferences
 
-        roles: Union[Unset, list[str]] = UNSET
-        if not isinstance(self.roles, Unset):
-            roles = []
-            for roles_item_data in self.roles:
-                roles_item = roles_item_data.value
-                roles.append(roles_item)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "active": active,
-                "created_at": created_at,
-                "email": email,
-                "id": id,
-                "status": status,
-                "username": username,
-            }
-        )
+        roles: Unset | list[str] = UNSET
+        if self.roles is not UNSET:
+            roles = [str(roles_item_data) for roles_item_data in self.roles]
+
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "active": active,
+            "created_at": created_at,
+            "email": email,
+            "id": id,
+            "status": status,
+            "username": username,
+        }
         if preferences is not UNSET:
             field_dict["preferences"] = preferences
         if roles is not UNSET:
@@ -92,44 +81,36 @@ class User:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.preferences import Preferences
-
         d = dict(src_dict)
         active = d.pop("active")
 
-        created_at = isoparse(d.pop("created_at"))
+        created_at = parse_datetime(d.pop("created_at"))
 
         email = d.pop("email")
 
         id = d.pop("id")
 
-        status = AccountStatus(d.pop("status"))
+        _status = d.pop("status")
+        try:
+            status = _ACCOUNT_STATUS_LOOKUP[_status]
+        except (KeyError, TypeError):
+            status = AccountStatus(_status)
 
         username = d.pop("username")
 
-        def _parse_preferences(data: object) -> Union["Preferences", None, Unset]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        _preferences = d.pop("preferences", UNSET)
+        preferences: Preferences | None | Unset = _preferences
+        if isinstance(_preferences, dict):
             try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                preferences_type_1 = Preferences.from_dict(data)
-
-                return preferences_type_1
+                preferences = Preferences.from_dict(_preferences)
             except:  # noqa: E722
                 pass
-            return cast(Union["Preferences", None, Unset], data)
 
-        preferences = _parse_preferences(d.pop("preferences", UNSET))
-
-        roles = []
         _roles = d.pop("roles", UNSET)
-        for roles_item_data in _roles or []:
-            roles_item = Role(roles_item_data)
-
-            roles.append(roles_item)
+        try:
+            roles = [_ROLE_LOOKUP[roles_item_data] for roles_item_data in _roles or []]
+        except (KeyError, TypeError):
+            roles = [Role(roles_item_data) for roles_item_data in _roles]
 
         user = cls(
             active=active,
@@ -142,7 +123,8 @@ class User:
             roles=roles,
         )
 
-        user.additional_properties = d
+        if d:
+            user.additional_properties = d
         return user
 
     @property
@@ -0,0 +1,111 @@
+"""msgspec mirrors of the models in ``axum_server_client.models``
+
+Requires the ``msgspec`` extra. The structs have the same fields, ``UNSET`` handling and ``to_dict``/``from_dict``
+methods as the attrs models, but encoding and decoding (including the ISO-8601 timestamps) run in msgspec's C
+implementation. The output of ``to_dict`` differs from the attrs models in a few places:
+
+- UTC timestamps are written with a ``Z`` suffix instead of ``+00:00``.
+- Sub-microsecond fractions are rounded to the nearest microsecond instead of truncated
+  (``.1234567`` becomes ``.123457`` rather than ``.123456``).
+- A missing ``roles`` stays ``UNSET`` and is left out, where the attrs models fill in ``[]``.
+- Unknown keys are ignored rather than kept in ``additional_properties``.
+
+Response bodies can be decoded straight from bytes, skipping the intermediate ``response.json()`` dicts::
+
+    response = await users_list.asyncio_detailed(client=client)
+    users = msgspec.json.decode(response.content, type=list[User])
+"""
+
+import datetime
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+from .models.account_status import AccountStatus
+from .models.role import Role
+from .models.theme import Theme
+
+T = TypeVar("T", bound="_Struct")
+
+
+class _Struct(msgspec.Struct):
+    def to_dict(self) -> dict[str, Any]:
+        return msgspec.to_builtins(self)
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        return msgspec.convert(src_dict, cls)
+
+
+class CreateUserRequest(_Struct):
+    """
+    Attributes:
+        email (str):
+        username (str):
+        roles (UnsetType | list[Role]):
+        timezone (None | UnsetType | str):
+    """
+
+    email: str
+    username: str
+    roles: UnsetType | list[Role] = UNSET
+    timezone: None | UnsetType | str = UNSET
+
+
+class HealthStatus(_Struct):
+    """
+    Attributes:
+        checked_at (datetime.datetime):
+        status (str):
+        region (None | UnsetType | str):
+    """
+
+    checked_at: datetime.datetime
+    status: str
+    region: None | UnsetType | str = UNSET
+
+
+class Preferences(_Struct):
+    """
+    Attributes:
+        theme (Theme):
+        last_login_at (UnsetType | datetime.datetime):
+        timezone (None | UnsetType | str):
+    """
+
+    theme: Theme
+    last_login_at: UnsetType | datetime.datetime = UNSET
+    timezone: None | UnsetType | str = UNSET
+
+
+class User(_Struct):
+    """
+    Attributes:
+        active (bool):
+        created_at (datetime.datetime):
+        email (str):
+        id (int):
+        status (AccountStatus):
+        username (str):
+        preferences (Preferences | None | UnsetType):
+        roles (UnsetType | list[Role]):
+    """
+
+    active: bool
+    created_at: datetime.datetime
+    email: str
+    id: int
+    status: AccountStatus
+    username: str
+    preferences: Preferences | None | UnsetType = UNSET
+    roles: UnsetType | list[Role] = UNSET
+
+
+__all__ = (
+    "CreateUserRequest",
+    "HealthStatus",
+    "Preferences",
+    "User",
+)
@@ -0,0 +1,25 @@
+"""Optional Cython build of the model modules.
+
+The package itself is built by uv_build as pure Python; this script only exists to compile
+``axum_server_client/models`` in place for a faster ``to_dict``/``from_dict``:
+
+    AXUM_SERVER_CLIENT_ENABLE_SPEEDUPS=1 python setup.py build_ext --inplace
+
+Without the environment variable no extensions are built.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("AXUM_SERVER_CLIENT_ENABLE_SPEEDUPS"):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["axum_server_client/models/*.py"],
+        exclude=["axum_server_client/models/__init__.py"],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
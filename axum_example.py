@@ -8,25 +8,34 @@ from axum_server_client import Client
 from axum_server_client.api.users import health_get, user_create, user_get, users_list
 from axum_server_client.models import CreateUserRequest, Role
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 
 async def main() -> None:
     """Demonstrate basic usage of the Axum REST API."""
     client = Client(base_url="http://127.0.0.1:8000")
 
+    # The three reads are independent, so issue them concurrently
+    health, users, user_1 = await asyncio.gather(
+        health_get.asyncio(client=client),
+        users_list.asyncio(client=client),
+        user_get.asyncio(client=client, id=1),
+    )
+
     # Health check
-    health = await health_get.asyncio(client=client)
     print(f"Health: {health.status} at {health.checked_at}")
 
     # List users
-    users = await users_list.asyncio(client=client)
     print(f"Found {len(users)} users:")
     for user in users:
         roles = [role.value for role in user.roles] if user.roles else []
         print(f"  #{user.id}: {user.username} ({', '.join(roles)})")
 
     # Get specific user
-    user = await user_get.asyncio(client=client, id=1)
-    print(f"User #1: {user.username} <{user.email}>")
+    print(f"User #1: {user_1.username} <{user_1.email}>")
 
     # Create new user (idempotent)
     request = CreateUserRequest(
@@ -47,4 +56,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
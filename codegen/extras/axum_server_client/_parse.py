@@ -0,0 +1,32 @@
+"""Contains shared helpers for parsing properties"""
+
+import datetime
+
+# Timestamps in a response almost always share one offset, so hand out a single tzinfo per offset
+# instead of keeping the fresh one built for every parsed value.
+_TZ_CACHE: dict[datetime.timedelta, datetime.tzinfo] = {datetime.timedelta(0): datetime.UTC}
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp, sharing tzinfo objects between values with the same offset"""
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        # Only forms fromisoformat() rejects need dateutil, which is slow to import
+        from dateutil.parser import isoparse
+
+        parsed = isoparse(value)
+
+    offset = parsed.utcoffset()
+    if offset is None:
+        return parsed
+
+    cached = _TZ_CACHE.get(offset)
+    if cached is None:
+        cached = _TZ_CACHE.setdefault(offset, datetime.timezone(offset))
+    if parsed.tzinfo is not cached:
+        parsed = parsed.replace(tzinfo=cached)
+    return parsed
+
+
+__all__ = ["parse_datetime"]
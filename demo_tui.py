@@ -2,22 +2,23 @@
 """Interactive TUI demo for presentations comparing Axum REST vs ReflectAPI RPC."""
 
 import asyncio
+import contextlib
+import functools
 import inspect
-import json
+import os
+import signal
 import sys
-import time
-from typing import Any, Dict, List
+import textwrap
 import threading
-import queue
+from typing import Any, Dict
 
+import httpx
 from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
 from rich.syntax import Syntax
-from rich.table import Table
 from rich.text import Text
-from rich.columns import Columns
 from rich.align import Align
 
 from axum_server_client import Client as AxumClient
@@ -25,6 +26,35 @@ from axum_server_client.api.users import health_get, users_list, user_get
 from reflect_api_demo_client import AsyncClient as ReflectClient
 from reflect_api_demo_client.generated import ReflectServerGetUserRequest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+
+def _as_mapping(obj: Any) -> Dict[str, Any]:
+    """View an SDK response item as a dict, whether it came back as a dict or a model."""
+    if isinstance(obj, dict):
+        return obj
+    return getattr(obj, "__dict__", {})
+
+
+def _dedent_body(source: str) -> str:
+    """Return a function's source without its def line and docstring."""
+    return textwrap.dedent('\n'.join(source.split('\n')[2:])).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_code_panel(code: str, title: str, lang: str) -> Panel:
+    """Build a highlighted code panel; cached so a snippet shown again reuses the same panel."""
+    syntax = Syntax(code, lang, theme="monokai", line_numbers=True)
+    return Panel(syntax, title=f"[bold]{title}[/bold]", border_style="cyan")
+
 
 class DemoTUI:
     """Interactive TUI for comparing REST vs RPC APIs."""
@@ -32,10 +62,19 @@ class DemoTUI:
     def __init__(self, auto_advance: bool = False):
         self.console = Console()
         self.axum_client = AxumClient(base_url="http://127.0.0.1:8000")
-        self.reflect_client = ReflectClient(base_url="http://127.0.0.1:9000")
+        # One keep-alive pool for the RPC server, shared by the SDK and the raw error-handling call
+        self.http = httpx.AsyncClient(base_url="http://127.0.0.1:9000", timeout=30.0)
+        self.reflect_client = ReflectClient(base_url="http://127.0.0.1:9000", client=self.http)
         self.auto_advance = auto_advance
-        self.input_queue = queue.Queue()
-        self.input_thread = None
+        self.input_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._stdin_watched = False
+        self._stdin_partial = b""
+        
+        # Static render objects, built once and swapped in by reference on every step
+        self._rest_title_panel = Panel(Align.center("🦀 Axum REST API"), style="blue")
+        self._rpc_title_panel = Panel(Align.center("⚡ ReflectAPI RPC"), style="purple")
+        self._ready_output = self.make_output_panel("Output", "[dim]Ready to execute...[/dim]")
+        self._executing_output = self.make_output_panel("Output", "[yellow]Executing...[/yellow]")
         
     def create_layout(self) -> Layout:
         """Create the main layout."""
@@ -95,46 +134,99 @@ class DemoTUI:
 
     def make_code_panel(self, title: str, code: str, lang: str = "python") -> Panel:
         """Create a code panel."""
-        syntax = Syntax(code, lang, theme="monokai", line_numbers=True)
-        return Panel(syntax, title=f"[bold]{title}[/bold]", border_style="cyan")
+        return _build_code_panel(code, title, lang)
 
     def make_output_panel(self, title: str, content: str) -> Panel:
         """Create an output panel."""
         return Panel(content, title=f"[bold]{title}[/bold]", border_style="green")
 
-    def start_input_thread(self):
-        """Start background thread for reading input."""
-        def input_reader():
-            try:
-                while True:
-                    key = input()  # This will block until Enter is pressed
-                    self.input_queue.put(key.lower().strip())
-            except (EOFError, KeyboardInterrupt):
-                self.input_queue.put('quit')
-        
-        self.input_thread = threading.Thread(target=input_reader, daemon=True)
-        self.input_thread.start()
+    def _setup_stdin(self):
+        """Watch stdin from the event loop so each line lands in the input queue."""
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_reader(sys.stdin.fileno(), self._on_stdin)
+            self._stdin_watched = True
+        except (NotImplementedError, PermissionError):
+            # Windows loops can't watch the console and epoll refuses regular files,
+            # so fall back to a reader thread that hands lines to the loop
+            threading.Thread(target=self._read_stdin_lines, args=(loop,), daemon=True).start()
+
+    def _teardown_stdin(self):
+        """Stop watching stdin."""
+        if self._stdin_watched:
+            asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+            self._stdin_watched = False
+
+    def _read_stdin_lines(self, loop: asyncio.AbstractEventLoop):
+        """Blocking stdin reader for the thread fallback."""
+        try:
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(self.input_queue.put_nowait, line.lower().strip())
+            loop.call_soon_threadsafe(self.input_queue.put_nowait, 'quit')
+        except RuntimeError:
+            # The loop closed while we were blocked on input
+            pass
+
+    def _on_stdin(self):
+        """Queue every complete line that is ready on stdin, keeping any partial line for the next call."""
+        # Read the fd directly: sys.stdin.readline() would buffer lines past the first one,
+        # and this callback only fires again when more data reaches the fd
+        data = os.read(sys.stdin.fileno(), 4096)
+        if not data:  # EOF
+            self._teardown_stdin()
+            if self._stdin_partial:
+                self.input_queue.put_nowait(self._stdin_partial.decode(errors="replace").lower().strip())
+                self._stdin_partial = b""
+            self.input_queue.put_nowait('quit')
+            return
+        *lines, self._stdin_partial = (self._stdin_partial + data).split(b"\n")
+        for line in lines:
+            self.input_queue.put_nowait(line.decode(errors="replace").lower().strip())
 
     async def wait_for_input(self) -> bool:
         """Wait for user input. Returns True to continue, False to quit."""
         if self.auto_advance:
-            await asyncio.sleep(2)
-            return True
-        
-        # Wait for user input
-        while True:
+            # Advance after two seconds unless a line arrives first, so 'q' still quits straight away
             try:
-                # Check for input without blocking
-                user_input = self.input_queue.get_nowait()
-                if user_input in ['q', 'quit', 'exit']:
-                    return False
-                elif user_input == '' or user_input in ['', 'continue', 'next', 'y', 'yes']:
-                    return True
-                # For any other input, just continue
+                user_input = await asyncio.wait_for(self.input_queue.get(), timeout=2)
+            except TimeoutError:
                 return True
-            except queue.Empty:
-                # No input yet, wait a bit and check again
-                await asyncio.sleep(0.1)
+        else:
+            user_input = await self.input_queue.get()
+        
+        if user_input in ['q', 'quit', 'exit']:
+            return False
+        # Enter, 'next', 'y' or anything else continues
+        return True
+
+    async def wait_for_interrupt(self):
+        """Sleep until Ctrl+C without waking the event loop in between."""
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGINT, stop.set)
+        except NotImplementedError:
+            # No loop signal handlers on Windows; Ctrl+C cancels the wait instead
+            await stop.wait()
+            return
+        try:
+            await stop.wait()
+        finally:
+            loop.remove_signal_handler(signal.SIGINT)
+
+    @contextlib.contextmanager
+    def _refresh_on_resize(self, live: Live):
+        """Repaint on terminal resize, since Live without auto_refresh only redraws when asked."""
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None:  # Windows has no SIGWINCH
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(sigwinch, live.refresh)
+        try:
+            yield
+        finally:
+            loop.remove_signal_handler(sigwinch)
 
     async def run_demo(self):
         """Run the interactive demo."""
@@ -148,13 +240,24 @@ class DemoTUI:
             ("Error Handling", self.demo_error_handling),
         ]
         
-        # Start input thread for interactive mode
-        if not self.auto_advance:
-            self.start_input_thread()
+        # Read input from the event loop; in auto mode only from a terminal, where 'q' can cut the demo short
+        watch_stdin = not self.auto_advance or sys.stdin.isatty()
+        if watch_stdin:
+            self._setup_stdin()
         
         try:
-            with Live(layout, console=self.console, screen=True, redirect_stderr=False):
+            # Redraw once per phase rather than from Live's background refresh thread
+            with Live(layout, console=self.console, screen=True, redirect_stderr=False, auto_refresh=False) as live, \
+                    self._refresh_on_resize(live):
                 layout["header"].update(self.make_header())
+                layout["rest_title"].update(self._rest_title_panel)
+                layout["rpc_title"].update(self._rpc_title_panel)
+                
+                # Open a keep-alive connection to each server up front so the first step isn't paying for connects.
+                # One cheap request per pool is enough; every later call reuses these sockets.
+                layout["footer"].update(self.make_footer("Starting", "Warming up connections..."))
+                live.refresh()
+                await self._execute_health()
                 
                 for step_name, step_func in steps:
                     # Show step introduction
@@ -162,23 +265,13 @@ class DemoTUI:
                     
                     # Show what we're about to do
                     rest_code, rpc_code = step_func(demo_mode=True)
-                
-                    layout["rest_title"].update(
-                        Panel(Align.center("🦀 Axum REST API"), style="blue")
-                    )
-                    layout["rpc_title"].update(
-                        Panel(Align.center("⚡ ReflectAPI RPC"), style="purple")
-                    )
                     
                     layout["rest_code"].update(self.make_code_panel("Code", rest_code))
                     layout["rpc_code"].update(self.make_code_panel("Code", rpc_code))
                     
-                    layout["rest_output"].update(
-                        self.make_output_panel("Output", "[dim]Ready to execute...[/dim]")
-                    )
-                    layout["rpc_output"].update(
-                        self.make_output_panel("Output", "[dim]Ready to execute...[/dim]")
-                    )
+                    layout["rest_output"].update(self._ready_output)
+                    layout["rpc_output"].update(self._ready_output)
+                    live.refresh()
                     
                     # Wait for user input to proceed
                     if not await self.wait_for_input():
@@ -186,38 +279,33 @@ class DemoTUI:
                     
                     # Show executing state
                     layout["footer"].update(self.make_footer(step_name, "Executing..."))
-                    layout["rest_output"].update(
-                        self.make_output_panel("Output", "[yellow]Executing...[/yellow]")
-                    )
-                    layout["rpc_output"].update(
-                        self.make_output_panel("Output", "[yellow]Executing...[/yellow]")
-                    )
+                    layout["rest_output"].update(self._executing_output)
+                    layout["rpc_output"].update(self._executing_output)
+                    live.refresh()
                     
                     # Execute and show results
                     rest_result, rpc_result = await step_func(demo_mode=False)
                     
-                    layout["rest_output"].update(
-                        self.make_output_panel("Output", rest_result)
-                    )
-                    layout["rpc_output"].update(
-                        self.make_output_panel("Output", rpc_result)
-                    )
+                    layout["rest_output"].update(self.make_output_panel("Output", rest_result))
+                    layout["rpc_output"].update(self.make_output_panel("Output", rpc_result))
                     
                     # Show results and wait before next step
                     layout["footer"].update(self.make_footer(step_name, "Results displayed"))
+                    live.refresh()
                     if not await self.wait_for_input():
                         break
             
                 # Final summary
                 layout["footer"].update(self.make_footer("Demo Complete! 🎉", "Press Ctrl+C to exit"))
-                try:
-                    while True:
-                        await asyncio.sleep(1)
-                except KeyboardInterrupt:
-                    pass
+                live.refresh()
+                await self.wait_for_interrupt()
         except KeyboardInterrupt:
             # Clean exit on Ctrl+C
             pass
+        finally:
+            if watch_stdin:
+                self._teardown_stdin()
+            await self.http.aclose()
 
     def demo_health(self, demo_mode: bool = False):
         """Demo health check endpoints."""
@@ -241,28 +329,28 @@ print(f"Checked: {health['checked_at']}")'''
 
     async def _execute_health(self):
         """Execute health check for both APIs."""
-        # REST API
-        try:
-            health = await health_get.asyncio(client=self.axum_client)
-            rest_output = f"Status: {health.status}\nRegion: {health.region}\nChecked: {health.checked_at}"
-        except Exception as e:
-            rest_output = f"Error: {e}"
+        async def _rest():
+            try:
+                health = await health_get.asyncio(client=self.axum_client)
+                return f"Status: {health.status}\nRegion: {health.region}\nChecked: {health.checked_at}"
+            except Exception as e:
+                return f"Error: {e}"
         
-        # RPC API
-        try:
-            response = await self.reflect_client.health.get()
-            if response.data:
-                health = response.data
-                status = health.get("status") if isinstance(health, dict) else getattr(health, "status", "?")
-                region = health.get("region") if isinstance(health, dict) else getattr(health, "region", "?")
-                checked_at = health.get("checked_at") if isinstance(health, dict) else getattr(health, "checked_at", "?")
-                rpc_output = f"Status: {status}\nRegion: {region}\nChecked: {checked_at}"
-            else:
-                rpc_output = "No data received"
-        except Exception as e:
-            rpc_output = f"Error: {e}"
-            
-        return rest_output, rpc_output
+        async def _rpc():
+            try:
+                response = await self.reflect_client.health.get()
+                if response.data:
+                    health = _as_mapping(response.data)
+                    status = health.get("status", "?")
+                    region = health.get("region", "?")
+                    checked_at = health.get("checked_at", "?")
+                    return f"Status: {status}\nRegion: {region}\nChecked: {checked_at}"
+                return "No data received"
+            except Exception as e:
+                return f"Error: {e}"
+        
+        # Both servers are queried at once
+        return await asyncio.gather(_rest(), _rpc())
 
     def demo_list_users(self, demo_mode: bool = False):
         """Demo user listing endpoints."""
@@ -292,71 +380,59 @@ for user in users[:3]:  # Show first 3
 
     async def _execute_list_users(self):
         """Execute user listing for both APIs."""
-        # REST API
-        try:
-            users = await users_list.asyncio(client=self.axum_client)
-            rest_lines = [f"Found {len(users)} users:"]
-            for user in users[:3]:
-                roles = [r.value for r in user.roles] if user.roles else []
-                rest_lines.append(f"  #{user.id}: {user.username}")
-                rest_lines.append(f"    Roles: {', '.join(roles)}")
-            rest_output = "\n".join(rest_lines)
-        except Exception as e:
-            rest_output = f"Error: {e}"
+        async def _rest():
+            try:
+                users = await users_list.asyncio(client=self.axum_client)
+                summaries = "".join(
+                    f"\n  #{user.id}: {user.username}\n    Roles: {', '.join(r.value for r in user.roles or ())}"
+                    for user in users[:3]
+                )
+                return f"Found {len(users)} users:{summaries}"
+            except Exception as e:
+                return f"Error: {e}"
         
-        # RPC API
-        try:
-            response = await self.reflect_client.users.list()
-            if response.data:
-                users = response.data
-                rpc_lines = [f"Found {len(users)} users:"]
-                for user in users[:3]:
-                    user_id = user.get("id") if isinstance(user, dict) else getattr(user, "id", "?")
-                    username = user.get("username") if isinstance(user, dict) else getattr(user, "username", "?")
-                    roles = user.get("roles", []) if isinstance(user, dict) else getattr(user, "roles", [])
-                    rpc_lines.append(f"  #{user_id}: {username}")
-                    rpc_lines.append(f"    Roles: {', '.join(str(r) for r in roles)}")
-                rpc_output = "\n".join(rpc_lines)
-            else:
-                rpc_output = "No data received"
-        except Exception as e:
-            rpc_output = f"Error: {e}"
-            
-        return rest_output, rpc_output
+        async def _rpc():
+            try:
+                response = await self.reflect_client.users.list()
+                if response.data:
+                    users = response.data
+                    summaries = "".join(
+                        f"\n  #{user.get('id', '?')}: {user.get('username', '?')}"
+                        f"\n    Roles: {', '.join(getattr(r, 'value', r) for r in user.get('roles') or ())}"
+                        for user in map(_as_mapping, users[:3])
+                    )
+                    return f"Found {len(users)} users:{summaries}"
+                return "No data received"
+            except Exception as e:
+                return f"Error: {e}"
+        
+        # Both servers are queried at once
+        return await asyncio.gather(_rest(), _rpc())
 
     def demo_get_user(self, demo_mode: bool = False):
         """Demo getting specific user."""
-        # Get source code from the actual executable functions
-        rest_source = inspect.getsource(axum_get_user_demo)
-        # Extract just the function body (skip def line and docstring)
-        rest_lines = rest_source.split('\n')[2:]  # Skip def and docstring
-        rest_code = '\n'.join(line[4:] if line.startswith('    ') else line for line in rest_lines).strip()
-        
-        rpc_source = inspect.getsource(reflect_get_user_demo)
-        # Extract just the function body (skip def line and docstring)  
-        rpc_lines = rpc_source.split('\n')[2:]  # Skip def and docstring
-        rpc_code = '\n'.join(line[4:] if line.startswith('    ') else line for line in rpc_lines).strip()
-
+        # Code is shown from the actual executable functions, extracted once at import
         if demo_mode:
-            return rest_code, rpc_code
+            return _AXUM_GET_USER_SRC, _REFLECT_GET_USER_SRC
             
         return self._execute_get_user()
 
     async def _execute_get_user(self):
         """Execute get user for both APIs using single source of truth functions."""
-        # REST API
-        try:
-            rest_output = await axum_get_user_demo(self.axum_client)
-        except Exception as e:
-            rest_output = f"Error: {e}"
+        async def _rest():
+            try:
+                return await axum_get_user_demo(self.axum_client)
+            except Exception as e:
+                return f"Error: {e}"
         
-        # RPC API
-        try:
-            rpc_output = await reflect_get_user_demo(self.reflect_client)
-        except Exception as e:
-            rpc_output = f"Error: {e}"
-            
-        return rest_output, rpc_output
+        async def _rpc():
+            try:
+                return await reflect_get_user_demo(self.reflect_client)
+            except Exception as e:
+                return f"Error: {e}"
+        
+        # Both servers are queried at once
+        return await asyncio.gather(_rest(), _rpc())
 
     def demo_error_handling(self, demo_mode: bool = False):
         """Demo error handling."""
@@ -372,18 +448,14 @@ else:
     print(f"Unexpected: {response.status_code}")'''
 
         rpc_code = '''# ReflectAPI RPC - Error Handling
-import httpx
-async with httpx.AsyncClient() as http_client:
-    response = await http_client.post(
-        "http://127.0.0.1:9000/user.get",
-        json={"id": 9999}
-    )
-    if response.status_code == 404:
-        error = response.json()
-        print(f"Error: {error['code']}")
-        print(f"Message: {error['message']}")
-    else:
-        print(f"Unexpected: {response.status_code}")'''
+# http: the httpx.AsyncClient the SDK client was built with
+response = await http.post("/user.get", json={"id": 9999})
+if response.status_code == 404:
+    error = orjson.loads(response.content) if orjson is not None else response.json()
+    print(f"Error: {error['code']}")
+    print(f"Message: {error['message']}")
+else:
+    print(f"Unexpected: {response.status_code}")'''
 
         if demo_mode:
             return rest_code, rpc_code
@@ -392,89 +464,58 @@ async with httpx.AsyncClient() as http_client:
 
     async def _execute_error_handling(self):
         """Execute error handling demo for both APIs."""
-        # REST API
-        try:
-            from axum_server_client.api.users import user_get
-            from axum_server_client.models import ApiError
-            from http import HTTPStatus
-            
-            response = await user_get.asyncio_detailed(client=self.axum_client, id=9999)
-            if response.status_code == HTTPStatus.NOT_FOUND:
-                if isinstance(response.parsed, ApiError):
-                    rest_output = f"Error: {response.parsed.code}\nMessage: {response.parsed.message}"
-                else:
-                    rest_output = f"404 but unexpected format: {response.content}"
-            else:
-                rest_output = f"Unexpected: {response.status_code}"
-        except Exception as e:
-            rest_output = f"Error: {e}"
+        async def _rest():
+            try:
+                from axum_server_client.models import ApiError
+                from http import HTTPStatus
+                
+                response = await user_get.asyncio_detailed(client=self.axum_client, id=9999)
+                if response.status_code == HTTPStatus.NOT_FOUND:
+                    if isinstance(response.parsed, ApiError):
+                        return f"Error: {response.parsed.code}\nMessage: {response.parsed.message}"
+                    return f"404 but unexpected format: {response.content}"
+                return f"Unexpected: {response.status_code}"
+            except Exception as e:
+                return f"Error: {e}"
         
-        # RPC API
-        try:
-            import httpx
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.post(
-                    "http://127.0.0.1:9000/user.get",
-                    json={"id": 9999}
-                )
+        async def _rpc():
+            try:
+                response = await self.http.post("/user.get", json={"id": 9999})
                 if response.status_code == 404:
-                    error = response.json()
-                    rpc_output = f"Error: {error.get('code', 'unknown')}\nMessage: {error.get('message', 'unknown')}"
-                else:
-                    rpc_output = f"Unexpected: {response.status_code}"
-        except Exception as e:
-            rpc_output = f"Error: {e}"
-            
-        return rest_output, rpc_output
+                    error = orjson.loads(response.content) if orjson is not None else response.json()
+                    return f"Error: {error.get('code', 'unknown')}\nMessage: {error.get('message', 'unknown')}"
+                return f"Unexpected: {response.status_code}"
+            except Exception as e:
+                return f"Error: {e}"
+        
+        # Both servers are queried at once
+        return await asyncio.gather(_rest(), _rpc())
 
 
 # Standalone executable functions for single source of truth
 async def axum_get_user_demo(client: AxumClient) -> str:
     """Axum REST API - Get User"""
     user = await user_get.asyncio(client=client, id=1)
-    lines = [
-        f"User: {user.username} <{user.email}>",
-        f"Status: {user.status.value}",
-    ]
+    summary = f"User: {user.username} <{user.email}>\nStatus: {user.status.value}"
     if user.preferences:
-        lines.extend([
-            f"Theme: {user.preferences.theme.value}",
-            f"Timezone: {user.preferences.timezone}"
-        ])
-    return "\n".join(lines)
+        summary += f"\nTheme: {user.preferences.theme.value}\nTimezone: {user.preferences.timezone}"
+    return summary
 
 
 async def reflect_get_user_demo(client: ReflectClient) -> str:
     """ReflectAPI RPC - Get User (generated SDK)"""
     request = ReflectServerGetUserRequest(id=1)
     user_response = await client.user.get(data=request)
-    if user_response.data:
-        user = user_response.data
-        username = user.get("username") if isinstance(user, dict) else getattr(user, "username", "?")
-        email = user.get("email") if isinstance(user, dict) else getattr(user, "email", "?")
-        status_raw = user.get("status") if isinstance(user, dict) else getattr(user, "status", "?")
-        # Extract clean status value (remove enum prefix if present)
-        status = status_raw.split('.')[-1].lower() if isinstance(status_raw, str) and '.' in str(status_raw) else status_raw
-        lines = [
-            f"User: {username} <{email}>",
-            f"Status: {status}",
-        ]
-        
-        # Extract preferences if available
-        preferences = user.get("preferences") if isinstance(user, dict) else getattr(user, "preferences", None)
-        if preferences:
-            theme_raw = preferences.get("theme") if isinstance(preferences, dict) else getattr(preferences, "theme", "?")
-            # Extract clean theme value (remove enum prefix if present)
-            theme = theme_raw.split('.')[-1].lower() if isinstance(theme_raw, str) and '.' in str(theme_raw) else theme_raw
-            timezone = preferences.get("timezone") if isinstance(preferences, dict) else getattr(preferences, "timezone", "?")
-            lines.extend([
-                f"Theme: {theme}",
-                f"Timezone: {timezone}"
-            ])
-            
-        return "\n".join(lines)
-    else:
+    user = user_response.data
+    if not user:
         return "Error: No data returned"
+    summary = f"User: {user.username} <{user.email}>\nStatus: {user.status.value}"
+    if user.preferences:
+        summary += f"\nTheme: {user.preferences.theme.value}\nTimezone: {user.preferences.timezone}"
+    return summary
+
+_AXUM_GET_USER_SRC = _dedent_body(inspect.getsource(axum_get_user_demo))
+_REFLECT_GET_USER_SRC = _dedent_body(inspect.getsource(reflect_get_user_demo))
 
 
 async def main():
@@ -489,4 +530,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -2,6 +2,7 @@
 """Simple example client for the ReflectAPI server."""
 
 import asyncio
+from typing import Any, Dict
 
 from reflect_api_demo_client import AsyncClient
 from reflect_api_demo_client.generated import (
@@ -10,37 +11,52 @@ from reflect_api_demo_client.generated import (
     SharedModelsRole,
 )
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+
+def _as_mapping(obj: Any) -> Dict[str, Any]:
+    """View an SDK response item as a dict, whether it came back as a dict or a model."""
+    if isinstance(obj, dict):
+        return obj
+    return getattr(obj, "__dict__", {})
+
 
 async def main() -> None:
     """Demonstrate basic usage of the ReflectAPI server."""
     client = AsyncClient(base_url="http://127.0.0.1:9000")
 
+    # The three reads are independent, so issue them concurrently
+    health_response, users_response, user_response = await asyncio.gather(
+        client.health.get(),
+        client.users.list(),
+        client.user.get(data=ReflectServerGetUserRequest(id=1)),
+    )
+
     # Health check
-    health_response = await client.health.get()
     if health_response.data:
-        health = health_response.data
-        status = health.get("status") if isinstance(health, dict) else getattr(health, "status", "unknown")
+        health = _as_mapping(health_response.data)
+        status = health.get("status", "unknown")
         print(f"Health: {status}")
 
     # List users
-    users_response = await client.users.list()
     if users_response.data:
         users = users_response.data
         print(f"Found {len(users)} users:")
-        for user in users:
-            user_id = user.get("id") if isinstance(user, dict) else getattr(user, "id", "?")
-            username = user.get("username") if isinstance(user, dict) else getattr(user, "username", "?")
-            roles = user.get("roles", []) if isinstance(user, dict) else getattr(user, "roles", [])
-            roles_str = ", ".join(str(r) for r in roles) if roles else "none"
+        for user in map(_as_mapping, users):
+            user_id = user.get("id", "?")
+            username = user.get("username", "?")
+            roles = user.get("roles") or []
+            roles_str = ", ".join(getattr(r, "value", r) for r in roles) if roles else "none"
             print(f"  #{user_id}: {username} ({roles_str})")
 
     # Get specific user
-    request = ReflectServerGetUserRequest(id=1)
-    user_response = await client.user.get(data=request)
     if user_response.data:
-        user_data = user_response.data
-        username = user_data.get("username") if isinstance(user_data, dict) else getattr(user_data, "username", "?")
-        email = user_data.get("email") if isinstance(user_data, dict) else getattr(user_data, "email", "?")
+        user_data = _as_mapping(user_response.data)
+        username = user_data.get("username", "?")
+        email = user_data.get("email", "?")
         print(f"User #1: {username} <{email}>")
 
     # Create new user (idempotent)
@@ -54,9 +70,9 @@ async def main() -> None:
     try:
         created = await client.user.create(data=request)
         if created.data:
-            user = created.data
-            user_id = user.get("id") if isinstance(user, dict) else getattr(user, "id", "?")
-            username = user.get("username") if isinstance(user, dict) else getattr(user, "username", "?")
+            user = _as_mapping(created.data)
+            user_id = user.get("id", "?")
+            username = user.get("username", "?")
             print(f"Created user #{user_id}: {username}")
     except Exception as e:
         if "409" in str(e) and "user_exists" in str(e):
@@ -66,4 +82,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
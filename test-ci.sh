@@ -183,7 +183,11 @@ rm -rf "$UTOIPA_CLIENT_DIR" "$REFLECT_CLIENT_DIR"
 curl -fsS http://127.0.0.1:8000/api-docs/openapi.json -o "$ROOT_DIR/api.json"
 print_status "Downloaded utoipa OpenAPI spec"
 
-uv run openapi-python-client generate --path "$ROOT_DIR/api.json" --output-path "$UTOIPA_CLIENT_DIR" --overwrite --meta uv >/dev/null
+uv run openapi-python-client generate --path "$ROOT_DIR/api.json" --output-path "$UTOIPA_CLIENT_DIR" --overwrite --meta uv \
+    --custom-template-path "$ROOT_DIR/codegen/templates" >/dev/null
+
+# Hand-written modules the templates import (datetime parsing, msgspec models, Cython build)
+cp -r "$ROOT_DIR/codegen/extras/." "$UTOIPA_CLIENT_DIR/"
 
 # Update Python version requirement to match reflectapi-runtime requirements
 sed -i 's/requires-python = "~=3.9"/requires-python = ">=3.12"/' "$UTOIPA_CLIENT_DIR/pyproject.toml"
@@ -237,11 +241,13 @@ version = "0.1.0"
 description = "Demo of Rust-Python interop with auto-generated clients"
 requires-python = ">=3.12"
 dependencies = [
-    "openapi-python-client>=0.21.0",
+    "openapi-python-client>=0.26,<0.27",
     "axum-server-client",
     "reflect-api-demo-client",
     "rich>=13.0.0",
     "httpx>=0.25.0",
+    "uvloop>=0.19.0; sys_platform != 'win32'",
+    "orjson>=3.9.0",
 ]
 
 [tool.uv.sources]
@@ -260,7 +266,19 @@ dev = [
     "mypy>=1.18.1",
     "ty>=0.0.1a20",
     "pytest>=7.0.0",
-    "pytest-asyncio>=0.21.0",
+    "pytest-asyncio>=0.26.0",
+    "pytest-xdist>=3.5.0",
+    "respx>=0.21.0",
+    "msgspec>=0.18.0",
+]
+
+[tool.pytest.ini_options]
+asyncio_mode = "auto"
+asyncio_default_fixture_loop_scope = "session"
+asyncio_default_test_loop_scope = "session"
+markers = [
+    "integration: needs the Axum (:8000) and ReflectAPI (:9000) servers running",
+    "slow: per-check variants of tests that are also covered in a batch",
 ]
 
 [tool.hatch.build.targets.wheel]
@@ -292,7 +310,8 @@ fi
 
 # Run test suite
 echo "🧪 Running test suite..."
-if uv run pytest "$ROOT_DIR/test_apis.py" -q; then
+# Both servers are up here, so a test that can't reach one should fail rather than skip
+if REQUIRE_SERVERS=1 uv run pytest "$ROOT_DIR/test_apis.py" -q -n 3 --dist=loadgroup -m "not slow"; then
     print_status "pytest tests passed"
 else
     print_error "pytest tests failed"
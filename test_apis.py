@@ -2,37 +2,122 @@
 """Pytest test suite for both Axum and ReflectAPI servers."""
 
 import asyncio
+import json
+import os
 from http import HTTPStatus
 
 import httpx
 import pytest
+import pytest_asyncio
+import respx
 
 from axum_server_client import Client as AxumClient
 from axum_server_client.api.users import health_get, user_create, user_get, users_list
-from axum_server_client.models import ApiError, CreateUserRequest, Role
+from axum_server_client.models import ApiError, CreateUserRequest, Role, User
 from reflect_api_demo_client import AsyncClient as ReflectClient
 from reflect_api_demo_client.generated import (
+    ReflectServerGetUserRequest,
     SharedModelsCreateUserRequest,
     SharedModelsRole,
 )
+from reflectapi_runtime import ApplicationError
 
 
-@pytest.fixture
-def axum_client():
+# Localhost servers accept in well under a second, so a connect that takes longer means the server is wedged;
+# reads get more room since the first request after startup can be slow.
+_CLIENT_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+
+
+def _field(obj, name):
+    """Read a field from a ReflectAPI result, which may be a plain dict or a model."""
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+async def _probe(name, method, url):
+    """Skip the requesting tests unless something answers at ``url`` within half a second.
+
+    With ``REQUIRE_SERVERS`` set (as test-ci.sh does), a missing server fails the tests instead.
+    """
+    async with httpx.AsyncClient(timeout=0.5) as client:
+        try:
+            await client.request(method, url)
+        except (httpx.ConnectError, httpx.TimeoutException):
+            message = f"{name} server not running at {url}"
+            if os.environ.get("REQUIRE_SERVERS"):
+                pytest.fail(message)
+            pytest.skip(message)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def axum_server():
+    """Skip Axum integration tests quickly when :8000 is not listening."""
+    await _probe("axum", "GET", "http://127.0.0.1:8000/health")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def reflect_server():
+    """Skip ReflectAPI integration tests quickly when :9000 is not listening."""
+    await _probe("reflect", "POST", "http://127.0.0.1:9000/health.get")
+
+
+# Clients are shared by the whole session so their keep-alive connections are reused between tests;
+# that relies on the session-scoped event loop configured under [tool.pytest.ini_options] in pyproject.toml.
+@pytest_asyncio.fixture(scope="session")
+async def axum_client(axum_server):
     """Axum REST API client."""
-    return AxumClient(base_url="http://127.0.0.1:8000")
+    async with AxumClient(base_url="http://127.0.0.1:8000", timeout=_CLIENT_TIMEOUT) as client:
+        yield client
 
 
-@pytest.fixture  
-def reflect_client():
+@pytest_asyncio.fixture(scope="session")
+async def reflect_client(reflect_server):
     """ReflectAPI RPC client."""
-    return ReflectClient(base_url="http://127.0.0.1:9000")
+    # The SDK takes a single timeout value, so pass an httpx client carrying the split timeout;
+    # the SDK leaves a client it was given open, so it is closed here
+    async with httpx.AsyncClient(base_url="http://127.0.0.1:9000", timeout=_CLIENT_TIMEOUT) as http:
+        yield ReflectClient(base_url="http://127.0.0.1:9000", client=http)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def raw_httpx(reflect_server):
+    """Plain httpx client for hand-written ReflectAPI calls."""
+    async with httpx.AsyncClient(base_url="http://127.0.0.1:9000", timeout=_CLIENT_TIMEOUT) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def axum_users_snapshot(axum_client):
+    """Users listed by the Axum API, fetched once per session."""
+    users = await users_list.asyncio(client=axum_client)
+    assert users, "No users found - server may not be initialized"
+    return users
+
+
+@pytest_asyncio.fixture(scope="session")
+async def reflect_users_snapshot(reflect_client):
+    """Users listed by the ReflectAPI server, fetched once per session."""
+    response = await reflect_client.users.list()
+    assert response.data, "No users found - server may not be initialized"
+    return response.data
+
 
+@pytest.fixture(scope="session")
+def axum_first_user(axum_users_snapshot):
+    """First user listed by the Axum API."""
+    return axum_users_snapshot[0]
 
+
+@pytest.fixture(scope="session")
+def reflect_first_user(reflect_users_snapshot):
+    """First user listed by the ReflectAPI server."""
+    return reflect_users_snapshot[0]
+
+
+@pytest.mark.xdist_group("axum")
+@pytest.mark.integration
 class TestAxumAPI:
     """Test the Axum REST API server."""
 
-    @pytest.mark.asyncio
     async def test_health_check(self, axum_client):
         """Health endpoint should return status and timestamp."""
         health = await health_get.asyncio(client=axum_client)
@@ -40,7 +125,6 @@ class TestAxumAPI:
         assert health.checked_at is not None
         assert health.region == "us-east-1"
 
-    @pytest.mark.asyncio
     async def test_list_users(self, axum_client):
         """Users list should return array of users."""
         users = await users_list.asyncio(client=axum_client)
@@ -52,15 +136,9 @@ class TestAxumAPI:
         assert hasattr(user, 'username')
         assert hasattr(user, 'email')
 
-    @pytest.mark.asyncio
-    async def test_get_existing_user(self, axum_client):
+    async def test_get_existing_user(self, axum_client, axum_first_user):
         """Getting existing user should return user data."""
-        # First, ensure we have users by listing them
-        users = await users_list.asyncio(client=axum_client)
-        assert len(users) > 0, "No users found - server may not be initialized"
-        
-        # Get the first user's ID
-        first_user_id = users[0].id
+        first_user_id = axum_first_user.id
         
         # Test getting that specific user
         user = await user_get.asyncio(client=axum_client, id=first_user_id)
@@ -68,7 +146,6 @@ class TestAxumAPI:
         assert user.username is not None
         assert user.email is not None
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_user(self, axum_client):
         """Getting nonexistent user should return 404 with error."""
         # Use a very high ID that's unlikely to exist
@@ -79,15 +156,10 @@ class TestAxumAPI:
         assert response.parsed.code == "user_not_found"
         assert str(nonexistent_id) in response.parsed.message
 
-    @pytest.mark.asyncio
-    async def test_create_duplicate_user(self, axum_client):
+    async def test_create_duplicate_user(self, axum_client, axum_first_user):
         """Creating duplicate user should return 409 conflict."""
-        # First get the list of existing users to find one to duplicate
-        users = await users_list.asyncio(client=axum_client)
-        assert len(users) > 0, "No users found - server may not be initialized"
-        
         # Use the first existing user for duplication test
-        existing_user = users[0]
+        existing_user = axum_first_user
         request = CreateUserRequest(
             username=existing_user.username,
             email=existing_user.email,
@@ -101,20 +173,20 @@ class TestAxumAPI:
         assert "already exists" in response.parsed.message
 
 
+@pytest.mark.xdist_group("reflect")
+@pytest.mark.integration
 class TestReflectAPI:
     """Test the ReflectAPI RPC server."""
 
-    @pytest.mark.asyncio
     async def test_health_check(self, reflect_client):
         """Health operation should return status and timestamp."""
         response = await reflect_client.health.get()
         assert response.data is not None
         
         health = response.data
-        status = health.get("status") if isinstance(health, dict) else getattr(health, "status", None)
+        status = _field(health, "status")
         assert status == "ok"
 
-    @pytest.mark.asyncio
     async def test_list_users(self, reflect_client):
         """Users list operation should return array of users."""
         response = await reflect_client.users.list()
@@ -125,58 +197,41 @@ class TestReflectAPI:
         assert len(users) > 0
         
         user = users[0]
-        user_id = user.get("id") if isinstance(user, dict) else getattr(user, "id", None)
-        username = user.get("username") if isinstance(user, dict) else getattr(user, "username", None)
+        user_id = _field(user, "id")
+        username = _field(user, "username")
         assert user_id is not None
         assert username is not None
 
-    @pytest.mark.asyncio
-    async def test_get_existing_user_manual(self, reflect_client):
+    async def test_get_existing_user_manual(self, reflect_first_user, raw_httpx):
         """Getting existing user via manual API call should work."""
-        # First get the list of users to find an existing one
-        users_response = await reflect_client.users.list()
-        assert users_response.data is not None
-        users = users_response.data
-        assert len(users) > 0, "No users found - server may not be initialized"
-        
-        # Use the first user's ID for testing
-        first_user = users[0]
-        first_user_id = first_user.get("id") if isinstance(first_user, dict) else getattr(first_user, "id")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post("http://127.0.0.1:9000/user.get", json={"id": first_user_id})
-            assert response.status_code == 200
-            
-            user_data = response.json()
-            assert user_data["id"] == first_user_id
-            assert "username" in user_data
-            assert "email" in user_data
-
-    @pytest.mark.asyncio
-    async def test_get_nonexistent_user_manual(self):
+        first_user = reflect_first_user
+        first_user_id = _field(first_user, "id")
+        assert first_user_id is not None
+        
+        response = await raw_httpx.post("/user.get", json={"id": first_user_id})
+        assert response.status_code == 200
+        
+        user_data = response.json()
+        assert user_data["id"] == first_user_id
+        assert "username" in user_data
+        assert "email" in user_data
+
+    async def test_get_nonexistent_user_manual(self, raw_httpx):
         """Getting nonexistent user should return error."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post("http://127.0.0.1:9000/user.get", json={"id": 9999})
-            assert response.status_code == 404
-            
-            error_data = response.json()
-            assert "code" in error_data
-            assert "message" in error_data
-            assert "9999" in error_data["message"]
-
-    @pytest.mark.asyncio
-    async def test_create_duplicate_user(self, reflect_client):
-        """Creating duplicate user should return conflict error."""
-        # First get the list of existing users to find one to duplicate
-        users_response = await reflect_client.users.list()
-        assert users_response.data is not None
-        users = users_response.data
-        assert len(users) > 0, "No users found - server may not be initialized"
+        response = await raw_httpx.post("/user.get", json={"id": 9999})
+        assert response.status_code == 404
         
+        error_data = response.json()
+        assert "code" in error_data
+        assert "message" in error_data
+        assert "9999" in error_data["message"]
+
+    async def test_create_duplicate_user(self, reflect_client, reflect_first_user):
+        """Creating duplicate user should return conflict error."""
         # Use the first existing user for duplication test
-        existing_user = users[0]
-        existing_username = existing_user.get("username") if isinstance(existing_user, dict) else getattr(existing_user, "username")
-        existing_email = existing_user.get("email") if isinstance(existing_user, dict) else getattr(existing_user, "email")
+        existing_user = reflect_first_user
+        existing_username = _field(existing_user, "username")
+        existing_email = _field(existing_user, "email")
         
         request = SharedModelsCreateUserRequest(
             username=existing_username,
@@ -192,52 +247,217 @@ class TestReflectAPI:
         assert "409" in error_str and "user_exists" in error_str
 
 
+@pytest.mark.xdist_group("consistency")
+@pytest.mark.integration
 class TestAPIConsistency:
     """Test that both APIs return consistent data."""
 
-    @pytest.mark.asyncio
+    async def test_consistency_batch(self, axum_client, reflect_client, raw_httpx, axum_first_user):
+        """Every cross-API check below, with all six requests sent in one concurrent burst."""
+        first_user_id = axum_first_user.id
+        (
+            axum_health,
+            reflect_health_response,
+            axum_users,
+            reflect_users_response,
+            axum_user,
+            reflect_user_response,
+        ) = await asyncio.gather(
+            health_get.asyncio(client=axum_client),
+            reflect_client.health.get(),
+            users_list.asyncio(client=axum_client),
+            reflect_client.users.list(),
+            user_get.asyncio(client=axum_client, id=first_user_id),
+            raw_httpx.post("/user.get", json={"id": first_user_id}),
+        )
+
+        assert axum_health.status == _field(reflect_health_response.data, "status") == "ok"
+        assert len(axum_users) == len(reflect_users_response.data)
+
+        reflect_user = reflect_user_response.json()
+        assert axum_user.id == reflect_user["id"]
+        assert axum_user.username == reflect_user["username"]
+        assert axum_user.email == reflect_user["email"]
+
+    # The per-check tests below cover the same ground one comparison at a time, for narrowing down a failure.
+    @pytest.mark.slow
     async def test_health_consistency(self, axum_client, reflect_client):
         """Both APIs should return the same health status."""
-        # Get health from both APIs
-        axum_health = await health_get.asyncio(client=axum_client)
-        reflect_response = await reflect_client.health.get()
+        # Get health from both APIs concurrently
+        axum_health, reflect_response = await asyncio.gather(
+            health_get.asyncio(client=axum_client),
+            reflect_client.health.get(),
+        )
         reflect_health = reflect_response.data
         
         # Extract status
         axum_status = axum_health.status
-        reflect_status = (reflect_health.get("status") if isinstance(reflect_health, dict) 
-                         else getattr(reflect_health, "status", None))
+        reflect_status = _field(reflect_health, "status")
         
         assert axum_status == reflect_status == "ok"
 
-    @pytest.mark.asyncio
-    async def test_user_count_consistency(self, axum_client, reflect_client):
+    @pytest.mark.slow
+    async def test_user_count_consistency(self, axum_users_snapshot, reflect_users_snapshot):
         """Both APIs should return the same number of users."""
-        axum_users = await users_list.asyncio(client=axum_client)
-        reflect_response = await reflect_client.users.list()
-        reflect_users = reflect_response.data
-        
-        assert len(axum_users) == len(reflect_users)
+        assert len(axum_users_snapshot) == len(reflect_users_snapshot)
 
-    @pytest.mark.asyncio
-    async def test_user_data_consistency(self, axum_client):
+    @pytest.mark.slow
+    async def test_user_data_consistency(self, axum_client, axum_first_user, raw_httpx):
         """User data should be consistent between APIs."""
-        # First get the list of users to find an existing one
-        axum_users = await users_list.asyncio(client=axum_client)
-        assert len(axum_users) > 0, "No users found - server may not be initialized"
-        
         # Use the first user's ID for consistency testing
-        first_user_id = axum_users[0].id
+        first_user_id = axum_first_user.id
         
-        # Get user from Axum API
-        axum_user = await user_get.asyncio(client=axum_client, id=first_user_id)
-        
-        # Get user from ReflectAPI via manual call
-        async with httpx.AsyncClient() as client:
-            response = await client.post("http://127.0.0.1:9000/user.get", json={"id": first_user_id})
-            reflect_user = response.json()
+        # Get user from Axum API and from ReflectAPI via manual call, concurrently
+        axum_user, response = await asyncio.gather(
+            user_get.asyncio(client=axum_client, id=first_user_id),
+            raw_httpx.post("/user.get", json={"id": first_user_id}),
+        )
+        reflect_user = response.json()
         
         # Compare key fields
         assert axum_user.id == reflect_user["id"]
         assert axum_user.username == reflect_user["username"]
-        assert axum_user.email == reflect_user["email"]
\ No newline at end of file
+        assert axum_user.email == reflect_user["email"]
+
+
+# Canned responses for the mocked tests below, matching what the servers return for the seeded users.
+_MOCK_USER = {
+    "id": 1,
+    "username": "alice",
+    "email": "alice@example.com",
+    "created_at": "2024-05-01T12:00:00Z",
+    "roles": ["admin"],
+    "status": "active",
+    "active": True,
+}
+_MOCK_USER_NOT_FOUND = {"code": "user_not_found", "message": "User with id 999999 not found"}
+_MOCK_USER_EXISTS = {"code": "user_exists", "message": "User 'alice' already exists"}
+
+
+def _axum_mock_handler(request: httpx.Request) -> httpx.Response:
+    """Route a request to the Axum API's canned responses."""
+    path = request.url.path
+    if request.method == "POST" and path == "/users":
+        return httpx.Response(HTTPStatus.CONFLICT, json=_MOCK_USER_EXISTS)
+    if path == "/users":
+        return httpx.Response(HTTPStatus.OK, json=[_MOCK_USER])
+    if path == f"/users/{_MOCK_USER['id']}":
+        return httpx.Response(HTTPStatus.OK, json=_MOCK_USER)
+    return httpx.Response(HTTPStatus.NOT_FOUND, json=_MOCK_USER_NOT_FOUND)
+
+
+@pytest_asyncio.fixture
+async def axum_mock_client():
+    """Axum client whose requests are answered in-process by _axum_mock_handler."""
+    async with AxumClient(
+        base_url="http://127.0.0.1:8000",
+        httpx_args={"transport": httpx.MockTransport(_axum_mock_handler)},
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def reflect_mock():
+    """respx router standing in for the ReflectAPI server."""
+    with respx.mock(base_url="http://127.0.0.1:9000") as mock:
+        yield mock
+
+
+class TestAxumAPIMocked:
+    """Check the generated Axum client's response parsing without a server."""
+
+    async def test_list_users(self, axum_mock_client):
+        """Users list should parse into User models."""
+        users = await users_list.asyncio(client=axum_mock_client)
+        assert [user.id for user in users] == [1]
+        assert users[0].username == "alice"
+        assert users[0].roles == [Role.ADMIN]
+
+    async def test_get_nonexistent_user(self, axum_mock_client):
+        """A 404 body should parse into ApiError."""
+        response = await user_get.asyncio_detailed(client=axum_mock_client, id=999999)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert isinstance(response.parsed, ApiError)
+        assert response.parsed.code == "user_not_found"
+        assert "999999" in response.parsed.message
+
+    async def test_create_duplicate_user(self, axum_mock_client):
+        """A 409 body should parse into ApiError."""
+        request = CreateUserRequest(username="alice", email="alice@example.com", roles=[Role.ADMIN])
+        response = await user_create.asyncio_detailed(client=axum_mock_client, body=request)
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert isinstance(response.parsed, ApiError)
+        assert "already exists" in response.parsed.message
+
+
+    async def test_msgspec_users_match_attrs(self):
+        """msgspec_models.User should decode a users body to the same values as the attrs User."""
+        msgspec = pytest.importorskip("msgspec")
+        from axum_server_client.msgspec_models import User as StructUser
+
+        body = json.dumps([
+            {**_MOCK_USER, "preferences": None},
+            {
+                **_MOCK_USER,
+                "id": 2,
+                "username": "bob",
+                "created_at": "2024-05-02T08:30:15.250000+02:00",
+                "roles": ["editor", "viewer"],
+                "status": "suspended",
+                "preferences": {"theme": "dark", "timezone": "Europe/Berlin", "last_login_at": "2024-06-01T09:00:00Z"},
+            },
+        ]).encode()
+
+        structs = msgspec.json.decode(body, type=list[StructUser])
+        users = [User.from_dict(item) for item in json.loads(body)]
+
+        assert len(structs) == len(users) == 2
+        for struct, user in zip(structs, users):
+            assert (struct.id, struct.username, struct.email) == (user.id, user.username, user.email)
+            assert struct.active == user.active
+            assert struct.created_at == user.created_at
+            assert struct.created_at.utcoffset() == user.created_at.utcoffset()
+            assert struct.status is user.status
+            assert struct.roles == user.roles
+            assert all(isinstance(role, Role) for role in struct.roles)
+            if user.preferences is None:
+                assert struct.preferences is None
+            else:
+                assert struct.preferences.theme is user.preferences.theme
+                assert struct.preferences.timezone == user.preferences.timezone
+                assert struct.preferences.last_login_at == user.preferences.last_login_at
+
+
+class TestReflectAPIMocked:
+    """Check ReflectAPI request and error shapes against a respx-mocked server."""
+
+    async def test_get_existing_user(self, reflect_mock):
+        """user.get should send the id and parse the user."""
+        route = reflect_mock.post("/user.get", json={"id": 1}).respond(json=_MOCK_USER)
+        async with ReflectClient(base_url="http://127.0.0.1:9000") as client:
+            response = await client.user.get(data=ReflectServerGetUserRequest(id=1))
+        assert route.called
+        assert _field(response.data, "username") == "alice"
+
+    async def test_get_nonexistent_user(self, reflect_mock):
+        """user.get for an unknown id should raise with the error body."""
+        reflect_mock.post("/user.get").respond(HTTPStatus.NOT_FOUND, json=_MOCK_USER_NOT_FOUND)
+        async with ReflectClient(base_url="http://127.0.0.1:9000") as client:
+            with pytest.raises(ApplicationError) as exc_info:
+                await client.user.get(data=ReflectServerGetUserRequest(id=999999))
+        assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+        assert set(exc_info.value.error_data) == {"code", "message"}
+
+    async def test_create_duplicate_user(self, reflect_mock):
+        """A 409 from /user.create should surface as an error naming the code."""
+        reflect_mock.post("/user.create").respond(HTTPStatus.CONFLICT, json=_MOCK_USER_EXISTS)
+        request = SharedModelsCreateUserRequest(
+            username="alice",
+            email="alice@example.com",
+            roles=[SharedModelsRole.ADMIN],
+        )
+        async with ReflectClient(base_url="http://127.0.0.1:9000") as client:
+            with pytest.raises(ApplicationError) as exc_info:
+                await client.user.create(data=request)
+        assert exc_info.value.status_code == HTTPStatus.CONFLICT
+        assert exc_info.value.error_data["code"] == "user_exists"